@@ -6,6 +6,10 @@ from modules.environment import WumpusWorld
 from modules.visualization import InfoSection, MapSection, config
 
 
+FPS_ACTIVE = 60  # Frame cap while input or world updates are arriving
+FPS_IDLE = 30  # Frame cap while nothing changes on screen
+
+
 def init_environment():
     size = 8
     agent = HybridAgent(size=size)
@@ -38,12 +42,13 @@ def initialize():
 
 
 def process_events(events, env):
-    new_env = {**env}
+    # main() owns this dict, so mutate in place instead of copying it
+    # every frame just to maybe flip one flag
     for event in events:
         if event.type == pygame.QUIT:
-            new_env["is_running"] = False
+            env["is_running"] = False
             break
-    return new_env
+    return env
 
 
 def update_state(events, dt, env, sections):
@@ -83,12 +88,20 @@ def main():
     ui_sections = initialize()
 
     dt = 0
+    dirty = True  # Force the first render
     while env["is_running"]:
         events = pygame.event.get()
-        env = update_state(events, dt, env, ui_sections)
-        render(screen, ui_sections, env)
-
-        dt = clock.tick(60)
+        new_env = update_state(events, dt, env, ui_sections)
+        if events or new_env != env:
+            dirty = True
+        env = new_env
+
+        if dirty:
+            render(screen, ui_sections, env)
+            dirty = False
+            dt = clock.tick(FPS_ACTIVE)
+        else:
+            dt = clock.tick(FPS_IDLE)  # Nothing changed, let the OS idle
 
     pygame.quit()
     sys.exit()
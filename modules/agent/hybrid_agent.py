@@ -1,10 +1,13 @@
 import random
+from bisect import bisect_left, bisect_right
+from collections import deque
 from itertools import product
 
-from modules.inference import KnowledgeBase, wumpus, pit, breeze, stench, glitter, scream
-from modules.planning import BayesNet, BayesNode, elimination_ask
+from modules.inference import KnowledgeBase, wumpus, pit, breeze, stench, scream
+from modules.planning import RoutePlanner
 from modules.utils import Orientation, Position, Action
 from modules.environment import Explorer
+from .reasoning_bank import ReasoningBank
 
 
 class HybridAgent(Explorer):
@@ -14,110 +17,302 @@ class HybridAgent(Explorer):
         self.k_wumpus = k_wumpus
         self.pit_prob = pit_prob
         self.kb = KnowledgeBase(size)
-        self.plan = []
+        self.plan = deque()
+
+        # The grid never changes, so enumerate cells and their in-bounds
+        # neighbors once instead of re-testing bounds on every call
+        self._all_cells = tuple(product(range(size), repeat=2))
+        self._neighbor_table = {
+            (i, j): tuple(
+                (x, y)
+                for x, y in ((i - 1, j), (i + 1, j), (i, j - 1), (i, j + 1))
+                if 0 <= x < size and 0 <= y < size
+            )
+            for i, j in self._all_cells
+        }
+
+        # Cell sets are stored as integer bitboards (bit x * size + y), so
+        # union/intersection/difference become single bitwise operations
+        self._cell_bit = {
+            (i, j): 1 << (i * size + j) for i, j in self._all_cells
+        }
+        self._neighbor_mask = {
+            cell: self._mask_from_cells(neighbors)
+            for cell, neighbors in self._neighbor_table.items()
+        }
         self.visited = set()
         self.frontier = set()
 
+        # Bank of safe labels derived in earlier ticks and earlier runs,
+        # shared with any other agents in this process
+        self._reason_bank = ReasoningBank.open()
+
+        # Derived position sets are memoized until the knowledge base or
+        # the visited/frontier boards move, so repeated property reads in
+        # one tick do not repeat their entailment queries
+        self._derived_key = None
+        self._derived_cache = {}
+
+        # Route planning is a pure function of its inputs, so results are
+        # reused across ticks when the agent re-plans from unchanged state
+        self._route_cache = {}
+
+    @property
+    def visited(self):
+        """Get the set of visited positions."""
+        return self._cells_from_mask(self._visited)
+
+    @visited.setter
+    def visited(self, cells):
+        """Set the visited positions from an iterable of cells."""
+        self._visited = self._mask_from_cells(cells)
+
+    @property
+    def frontier(self):
+        """Get the set of frontier positions."""
+        return self._cells_from_mask(self._frontier)
+
+    @frontier.setter
+    def frontier(self, cells):
+        """Set the frontier positions from an iterable of cells."""
+        self._frontier = self._mask_from_cells(cells)
+
     @property
     def safe_positions(self):
         """Get the safe positions in the knowledge base."""
-        positions = set()
-        for pos in self.visited | self.frontier:
-            if self.kb.ask_if_true([~wumpus(*pos), ~pit(*pos)]):
-                positions.add(pos)
-        return positions
+        return self._cells_from_mask(self._safe_mask())
 
     @property
     def uncertain_positions(self):
         """Get the uncertain positions in the knowledge base."""
-        position = set()
-        for pos in self.visited | self.frontier:
-            if self.kb.ask_if_true([~wumpus(*pos), ~pit(*pos)]) is None:
-                position.add(pos)
-        return position
+        return self._cells_from_mask(self._uncertain_mask())
 
     @property
     def wumpus_positions(self):
         """Get the positions of the wumpuses."""
-        positions = set()
-        for pos in self.frontier - self.safe_positions:
-            if self.kb.ask_if_true([wumpus(*pos)]):
-                positions.add(pos)
-        return positions
+        return self._derived("wumpus", self._compute_wumpus_positions)
 
     @property
     def pit_positions(self):
         """Get the positions of the pits."""
-        positions = set()
-        for pos in self.frontier - self.safe_positions:
-            if self.kb.ask_if_true([pit(*pos)]):
-                positions.add(pos)
-        return positions
+        return self._derived("pit", self._compute_pit_positions)
 
     @property
     def breeze_positions(self):
         """Get the positions of the breezes."""
-        positions = set()
-        for pos in self.visited:
-            if self.kb.ask_if_true([breeze(*pos)]):
-                positions.add(pos)
-        return positions
+        return self._derived("breeze", self._compute_breeze_positions)
 
     @property
     def stench_positions(self):
         """Get the positions of the stenches."""
-        positions = set()
-        for pos in self.visited:
-            if self.kb.ask_if_true([stench(*pos)]):
-                positions.add(pos)
-        return positions
+        return self._derived("stench", self._compute_stench_positions)
+
+    def _derived(self, name, compute):
+        """Memoize a derived value until the agent's knowledge moves.
+
+        The cache is keyed on the knowledge-base version and the visited and
+        frontier boards, the only inputs the derived position sets depend on.
+        """
+        key = (self.kb.version, self._visited, self._frontier)
+        if key != self._derived_key:
+            self._derived_key = key
+            self._derived_cache.clear()
+        if name not in self._derived_cache:
+            self._derived_cache[name] = compute()
+        return self._derived_cache[name]
+
+    def _compute_wumpus_positions(self):
+        """Collect the frontier positions provably holding a wumpus."""
+        classification = self._classification()
+        return {
+            pos
+            for pos in self._cells_from_mask(self._frontier & ~self._safe_mask())
+            if classification[pos] == "wumpus"
+        }
+
+    def _compute_pit_positions(self):
+        """Collect the frontier positions provably holding a pit."""
+        classification = self._classification()
+        return {
+            pos
+            for pos in self._cells_from_mask(self._frontier & ~self._safe_mask())
+            if classification[pos] == "pit"
+        }
+
+    def _compute_breeze_positions(self):
+        """Collect the visited positions where a breeze was perceived."""
+        return {
+            pos for pos in self.visited
+            if self.kb.ask_if_true([breeze(*pos)])
+        }
+
+    def _compute_stench_positions(self):
+        """Collect the visited positions where a stench was perceived."""
+        return {
+            pos for pos in self.visited
+            if self.kb.ask_if_true([stench(*pos)])
+        }
+
+    def _safe_mask(self):
+        """Get the bitboard of positions provably free of wumpus and pit."""
+        return self._derived("safe", self._compute_safe_mask)
+
+    def _uncertain_mask(self):
+        """Get the bitboard of positions whose safety is still unknown."""
+        return self._derived("uncertain", self._compute_uncertain_mask)
+
+    def _compute_safe_mask(self):
+        """Build the bitboard of positions provably free of wumpus and pit."""
+        mask = 0
+        for pos in self._cells_from_mask(self._visited | self._frontier):
+            if self._classify_safety(pos):
+                mask |= self._cell_bit[pos]
+        return mask
+
+    def _compute_uncertain_mask(self):
+        """Build the bitboard of positions whose safety is still unknown."""
+        mask = 0
+        for pos in self._cells_from_mask(self._visited | self._frontier):
+            if self._classify_safety(pos) is None:
+                mask |= self._cell_bit[pos]
+        return mask
+
+    def _classification(self):
+        """Get the batched knowledge-base classification of all known cells."""
+        return self._derived("classification", self._compute_classification)
+
+    def _compute_classification(self):
+        """Classify every visited and frontier cell in one KB pass."""
+        return self.kb.classify_cells(
+            self._cells_from_mask(self._visited | self._frontier)
+        )
+
+    def _classify_safety(self, pos):
+        """Classify a position as safe (True), unsafe (False) or unknown (None).
+
+        Frontier cells are first looked up in the reasoning bank by their
+        local-percept signature; only on a miss is the batched knowledge-base
+        classification consulted. Only safe labels that the signature itself
+        proves are banked: a hazard or unknown label can rest on knowledge
+        outside the signature, so replaying it for another cell with the
+        same surroundings would be unsound.
+        """
+        signature = None
+        if not self._visited & self._cell_bit[pos]:
+            signature = self._percept_signature(pos)
+            if signature and self._reason_bank.get(signature) is True:
+                return True
+
+        category = self._classification()[pos]
+        if category == "safe":
+            label = True
+        elif category == "unknown":
+            label = None
+        else:
+            label = False
+        if label is True and signature and _signature_proves_safe(signature):
+            self._reason_bank.put(signature, True)
+        return label
+
+    def _percept_signature(self, pos):
+        """Get the canonical percept signature of the visited cells around pos.
+
+        The signature captures the relative offset and breeze/stench state of
+        every visited neighbor, which is the local context the knowledge base
+        derives frontier-cell classifications from.
+        """
+        x, y = pos
+        signature = []
+        for nx, ny in self._neighbors(x, y):
+            if self._visited & self._cell_bit[(nx, ny)]:
+                signature.append((
+                    nx - x, ny - y,
+                    self.kb.ask_if_true([breeze(nx, ny)]),
+                    self.kb.ask_if_true([stench(nx, ny)]),
+                ))
+        return tuple(sorted(signature, key=lambda entry: entry[:2]))
+
+    def _mask_from_cells(self, cells):
+        """Encode an iterable of (x, y) cells as an integer bitboard."""
+        mask = 0
+        for x, y in cells:
+            mask |= 1 << (x * self.size + y)
+        return mask
+
+    def _cells_from_mask(self, mask):
+        """Decode an integer bitboard back into a set of (x, y) cells."""
+        cells = set()
+        while mask:
+            low = mask & -mask
+            cells.add(divmod(low.bit_length() - 1, self.size))
+            mask ^= low
+        return cells
 
     def _neighbors(self, i, j):
         """Get the neighboring cells of (i, j)."""
-        for x, y in [(i - 1, j), (i + 1, j), (i, j - 1), (i, j + 1)]:
-            if 0 <= x < self.size and 0 <= y < self.size:
-                yield x, y
+        return self._neighbor_table[(i, j)]
 
     def execute(self, percept, time):
         """Execute the agent's program based on the percept."""
         x, y = self.position.location
-        self.kb.tell_percept(x, y, percept)
-        self.kb.tell(~wumpus(x, y), ~pit(x, y))
-
-        self.k_wumpus -= 1 if percept.get("scream", False) else 0
-
-        self.visited.add((x, y))
+        self.kb.observe(x, y, percept)
+
+        if percept.get("scream"):
+            self.k_wumpus -= 1
+
+        # Fast path: re-walking an already-visited, percept-free cell with a
+        # plan in hand. The tell above added nothing the KB did not know, so
+        # the plan computed last tick is still the plan this tick would
+        # produce — follow it without re-deriving anything. Any percept flag
+        # (or a first visit) carries new information and falls through to
+        # the full re-plan below.
+        if self.plan and self._visited & self._cell_bit[(x, y)] and not any(
+            percept.get(flag)
+            for flag in ("breeze", "stench", "glitter", "scream", "bump")
+        ):
+            return self.plan.popleft()
+
+        self._visited |= self._cell_bit[(x, y)]
         # Visited positions should be safe
-        self.visited = {pos for pos in self.visited
-                        if pos in self.safe_positions}
+        self._visited &= self._safe_mask()
 
-        self.frontier.update(self._neighbors(x, y))
-        self.frontier.difference_update(self.visited)
+        self._frontier |= self._neighbor_mask[(x, y)]
+        self._frontier &= ~self._visited
         # Should include uncertain positions
-        self.frontier.update(self.uncertain_positions)
+        self._frontier |= self._uncertain_mask()
 
-        safe_positions = self.safe_positions
+        safe_mask = self._safe_mask()
+        safe_positions = self._cells_from_mask(safe_mask)
+        # Capture the derived position sets once per tick instead of
+        # re-deriving them at every use site below
+        uncertain_positions = self.uncertain_positions
+        stench_positions = self.stench_positions
 
-        self.plan = []  # Reset plan due to dynamic environment
+        self.plan.clear()  # Reset plan due to dynamic environment
 
         print(f"==================Current time step {time}===================")
         print(f"Current position: {self.position}")
         print(f"Does current position is safe: {(x, y) in safe_positions}")
         print(f"Safe positions: {safe_positions}")
-        print(f"Stench positions: {self.stench_positions}")
+        print(f"Stench positions: {stench_positions}")
 
-        if self.kb.ask_if_true([glitter()]):
+        # Glitter is a direct observation at the current cell, so read it
+        # from the percept instead of asking the knowledge base; has_gold
+        # keeps this branch routing the agent home after the grab
+        if percept.get("glitter", False) or self.has_gold:
             goals = (0, 0)
-            self.plan = []
-            self.plan.append(Action.GRAB) if not self.has_gold else None
-            temp = self.plan_route(self.position, goals, safe_positions)
-            self.plan.extend(temp)
-            if self.has_gold and self.location == goals:
+            self.plan.clear()
+            if not self.has_gold:
+                self.plan.append(Action.GRAB)
+            if self.location != goals:  # No-op route when already home
+                temp = self.plan_route(self.position, goals, safe_positions)
+                self.plan.extend(temp)
+            elif self.has_gold:
                 self.plan.append(Action.CLIMB)
 
         if len(self.plan) == 0:
             print("Planning to explore unvisited safe positions...")
-            unvisited_safe = self.frontier.intersection(safe_positions)
+            unvisited_safe = self._cells_from_mask(self._frontier & safe_mask)
             print(f"Unvisited safe positions: {unvisited_safe}")
 
             temp = self.plan_route(
@@ -128,7 +323,7 @@ class HybridAgent(Explorer):
         if len(self.plan) == 0:
             print("Planning to explore uncertain positions...")
             temp = self.plan_uncertain(
-                self.position, self.uncertain_positions, safe_positions
+                self.position, uncertain_positions, safe_positions
             )
             self.plan.extend(temp)
 
@@ -136,23 +331,28 @@ class HybridAgent(Explorer):
             print("Planning to shoot at Wumpus positions...")
             temp = self.plan_shot(
                 self.position, self.wumpus_positions, safe_positions,
-                sub_positions=self.stench_positions
-            )
-            self.plan.extend(temp)
-
-        if len(self.plan) == 0 and self.kb.ask_if_true([scream()]):
-            print(f"Planning to respond to scream...")
-            temp = self.plan_route(
-                self.position, self.stench_positions, safe_positions
+                sub_positions=stench_positions
             )
             self.plan.extend(temp)
 
         if len(self.plan) == 0:
+            # Respond to a scream first, then fall back to heading home;
+            # both routes share one planner over the same allowed set.
+            goal_sets = []
+            if self.kb.ask_if_true([scream()]):
+                print(f"Planning to respond to scream...")
+                goal_sets.append(stench_positions)
             print(f"Planning to return to the start position...")
             start = (0, 0)
-            temp = self.plan_route(self.position, start, safe_positions)
+            goal_sets.append(start)
+
+            temp, matched = self.plan_route_any(
+                self.position, goal_sets, safe_positions
+            )
             self.plan.extend(temp)
-            self.plan.append(Action.CLIMB) if self.location == start else None
+            if matched == len(goal_sets) - 1 or not temp:
+                self.plan.append(
+                    Action.CLIMB) if self.location == start else None
 
         if len(self.plan) == 0:
             print("No plan available, taking a random action.")
@@ -160,8 +360,7 @@ class HybridAgent(Explorer):
                 [Action.FORWARD, Action.TURN_LEFT, Action.TURN_RIGHT])
             return action
 
-        action = self.plan[0]
-        self.plan = self.plan[1:]
+        action = self.plan.popleft()
 
         print(f"Making a decision to take an action: {action}")
         return action
@@ -170,26 +369,84 @@ class HybridAgent(Explorer):
         """Plan a route from the current position to the goals."""
         if isinstance(goals, (list, set)) and len(goals) == 0:
             return []
+
+        # The agent's Position object is mutated as it moves, so the key
+        # snapshots its state instead of holding the object itself
+        if isinstance(goals, set):
+            goals_key = frozenset(goals)
+        elif isinstance(goals, list):
+            goals_key = tuple(goals)
+        else:
+            goals_key = goals
+        key = (
+            current.x, current.y, current.get_orientation(),
+            goals_key, frozenset(allowed),
+        )
+        cached = self._route_cache.get(key)
+        if cached is not None:
+            return list(cached)
+
         print("Planning route...")
-        from modules.planning import RoutePlanner
         planner = RoutePlanner(current, goals, allowed, self.size)
-        return planner.plan_route()
+        actions = planner.plan_route()
+
+        if len(self._route_cache) >= 256:
+            self._route_cache.pop(next(iter(self._route_cache)))
+        self._route_cache[key] = actions
+        return actions
+
+    def plan_route_any(self, current, goal_sets, allowed):
+        """Plan a route to the first of several prioritized goal sets.
+
+        A single planner is shared across the goal sets instead of building
+        one per fallback.
+        """
+        print("Planning route...")
+        planner = RoutePlanner(current, goal_sets[-1], allowed, self.size)
+        return planner.plan_route_any(goal_sets)
 
     def plan_shot(self, current, wumpus_positions, allowed, sub_positions=None):
         """Plan a shot at the wumpus positions."""
         shoot_positions = []
 
-        for pos in wumpus_positions:
-            x, y = pos
-            for p in range(0, self.size):
-                if p < x and (p, y) in allowed:
-                    shoot_positions.append(Position(p, y, Orientation.EAST))
-                if p > x and (p, y) in allowed:
-                    shoot_positions.append(Position(p, y, Orientation.WEST))
-                if p < y and (x, p) in allowed:
-                    shoot_positions.append(Position(x, p, Orientation.NORTH))
-                if p > y and (x, p) in allowed:
-                    shoot_positions.append(Position(x, p, Orientation.SOUTH))
+        if wumpus_positions:
+            # Index the allowed cells by row and column once, so the
+            # shooting origins per wumpus come from slicing the sorted
+            # row/column instead of scanning every cell for membership.
+            # The arrow traverses the whole row or column, so every
+            # aligned allowed cell is a valid origin — the route planner
+            # picks the cheapest one to actually reach.
+            by_row, by_col = {}, {}
+            for ax, ay in allowed:
+                by_row.setdefault(ay, []).append(ax)
+                by_col.setdefault(ax, []).append(ay)
+            for coords in by_row.values():
+                coords.sort()
+            for coords in by_col.values():
+                coords.sort()
+
+            # Distinct wumpuses can share shooting origins, so
+            # deduplicate while keeping a deterministic insertion order
+            seen = set()
+
+            def add_shot(px, py, orient):
+                if (px, py, orient) not in seen:
+                    seen.add((px, py, orient))
+                    shoot_positions.append(Position(px, py, orient))
+
+            for x, y in wumpus_positions:
+                xs = by_row.get(y, ())
+                if xs:
+                    for px in xs[:bisect_left(xs, x)]:
+                        add_shot(px, y, Orientation.EAST)
+                    for px in xs[bisect_right(xs, x):]:
+                        add_shot(px, y, Orientation.WEST)
+                ys = by_col.get(x, ())
+                if ys:
+                    for py in ys[:bisect_left(ys, y)]:
+                        add_shot(x, py, Orientation.NORTH)
+                    for py in ys[bisect_right(ys, y):]:
+                        add_shot(x, py, Orientation.SOUTH)
 
         if not shoot_positions and sub_positions:
             for x, y in sub_positions:
@@ -208,9 +465,9 @@ class HybridAgent(Explorer):
         if len(risk_positions) == 0:
             return []
 
-        # Compute the probabilities of pits in uncertain positions
-        pit_probabilities = self._compute_pit_probability(risk_positions)
-        wumpus_probabilities = self._compute_wumpus_probability(risk_positions)
+        # Compute the probabilities of pits and wumpuses in uncertain positions
+        pit_probabilities, wumpus_probabilities = \
+            self._compute_hazard_probabilities(risk_positions)
         low_risk_positions = self._filter_low_risk_positions(
             risk_positions, pit_probabilities, wumpus_probabilities
         )
@@ -221,20 +478,31 @@ class HybridAgent(Explorer):
 
         return self.plan_route(current, low_risk_positions, allowed)
 
-    def _compute_pit_probability(self, uncertain_positions):
-        """Compute the probability of pits in uncertain positions."""
-        uncertain_positions = set(pos for pos in uncertain_positions
-                                  if self.kb.ask_if_true([~pit(*pos)]) is None)
-        return self._compute_entity_probability(
-            uncertain_positions, pit, self.pit_prob
+    def _compute_hazard_probabilities(self, uncertain_positions):
+        """Compute the pit and wumpus probabilities in one fused sweep.
+
+        Both hazards are evaluated over the same uncertain cells, so the
+        cell set is built once and each entity's known positions and
+        percept witnesses are threaded through explicitly.
+
+        Args:
+            uncertain_positions: The cells whose safety is still unknown.
+
+        Returns:
+            tuple[dict, dict]: The pit and wumpus probabilities per cell.
+        """
+        positions = set(uncertain_positions)
+        specs = (
+            (pit, self.pit_prob,
+             self.pit_positions, self.breeze_positions),
+            (wumpus, self.k_wumpus / self.size**2,
+             self.wumpus_positions, self.stench_positions),
         )
-
-    def _compute_wumpus_probability(self, uncertain_positions):
-        """Compute the probability of wumpuses in uncertain positions."""
-        uncertain_positions = set(pos for pos in uncertain_positions
-                                  if self.kb.ask_if_true([~wumpus(*pos)]) is None)
-        return self._compute_entity_probability(
-            uncertain_positions, wumpus, self.k_wumpus / self.size**2
+        return tuple(
+            self._compute_entity_probability(
+                positions, entity_func, entity_prob, entity_pos, percept_pos
+            )
+            for entity_func, entity_prob, entity_pos, percept_pos in specs
         )
 
     def _filter_low_risk_positions(self, risk_positions, pit_prob, wumpus_prob):
@@ -242,85 +510,220 @@ class HybridAgent(Explorer):
         if not risk_positions:
             return []
 
-        # Calculate combined risk for each position
-        position_risks = {}
-        for pos in risk_positions:
-            combined_risk = pit_prob.get(pos, 0.0) + wumpus_prob.get(pos, 0.0)
-            position_risks[pos] = combined_risk
-
-        # Find the minimum risk value
-        min_risk = min(position_risks.values())
+        # Pair each position with its combined risk in one pass
+        risks = [
+            (pit_prob.get(pos, 0.0) + wumpus_prob.get(pos, 0.0), pos)
+            for pos in risk_positions
+        ]
+        min_risk = min(risk for risk, _ in risks)
 
         # If the minimum risk is too high, return empty list
         if min_risk > 0.5:
             return []
 
-        # Return all positions that have the minimum risk
-        import math
-        lowest_risk_positions = [
-            pos for pos, risk in position_risks.items()
-            if math.isclose(risk, min_risk)
-        ]
-
-        return lowest_risk_positions
+        # Return all positions within float tolerance of the minimum risk
+        return [pos for risk, pos in risks if risk <= min_risk + 1e-9]
 
-    def _compute_entity_probability(self, positions, entity_func, entity_prob):
-        """Compute the probability of entities in uncertain positions."""
-        entity_pos = self.pit_positions if entity_func.__name__ == "pit" else self.wumpus_positions
-        percept_func = breeze if entity_func.__name__ == "pit" else stench
-        percept_pos = self.breeze_positions if percept_func.__name__ == "breeze" else self.stench_positions
+    def _compute_entity_probability(self, positions, entity_func, entity_prob,
+                                    entity_pos, percept_pos):
+        """Compute the probability of entities in uncertain positions.
 
-        cells = positions | entity_pos
+        Cells whose state the knowledge base can already prove are settled
+        with a single query each and never enter the enumeration; only the
+        genuinely unknown cells are partitioned into connected components
+        linked by shared percept witnesses and solved independently.
+        """
+        results = {}
+        cells = set()
+        for pos in positions - entity_pos:
+            provable = self.kb.ask_if_true([~entity_func(*pos)])
+            if provable:  # Provably free of the entity
+                continue
+            if provable is False:  # Provably holds the entity
+                results[pos] = 1.0
+                continue
+            cells.add(pos)
         if not cells:
-            return {}
-
-        # Create BayesNet for entities
-        bayes_net = BayesNet()
-        for cell in cells:
-            node = BayesNode(entity_func(*cell).name, [], entity_prob)
-            bayes_net.add_node(node)
-
-        evidence = {}
+            return results
 
-        # Add percept nodes to the BayesNet
-        known_percepts = map(
-            lambda pos: percept_func(*pos).name, percept_pos
-        )
-        for node in self._make_bayes_node(known_percepts, cells, entity_func):
-            bayes_net.add_node(node)
-            evidence[node.variable] = True
+        for component, witnesses in self._constraint_components(cells, percept_pos):
+            results.update(self._component_probability(
+                component, witnesses, entity_pos, entity_prob
+            ))
+        return results
 
-        # Add known entities to the BayesNet
-        known_entities = map(
-            lambda pos: entity_func(*pos).name, entity_pos
+    def _constraint_components(self, cells, percept_pos):
+        """Partition uncertain cells into independent constraint components.
+
+        Two cells belong to the same component when a visited percept cell
+        (a breeze/stench witness) is adjacent to both, since only then do
+        their assignments constrain each other.
+
+        Args:
+            cells (set[tuple[int, int]]): The uncertain cells to partition.
+            percept_pos (set[tuple[int, int]]): Cells with a known percept.
+
+        Returns:
+            list[tuple[list, set]]: Pairs of (component cells, witnesses).
+        """
+        witness_cells = {}
+        for witness in percept_pos:
+            adjacent = [c for c in self._neighbors(*witness) if c in cells]
+            if adjacent:
+                witness_cells[witness] = adjacent
+
+        components = []
+        unassigned = set(cells)
+        while unassigned:
+            seed = unassigned.pop()
+            component, queue, witnesses = [seed], [seed], set()
+            while queue:
+                cell = queue.pop()
+                for witness, adjacent in witness_cells.items():
+                    if cell not in adjacent or witness in witnesses:
+                        continue
+                    witnesses.add(witness)
+                    for other in adjacent:
+                        if other in unassigned:
+                            unassigned.discard(other)
+                            component.append(other)
+                            queue.append(other)
+            components.append((component, witnesses))
+        return components
+
+    def _component_probability(self, component, witnesses, entity_pos, entity_prob):
+        """Enumerate entity assignments for one component of uncertain cells.
+
+        A configuration is consistent when every witness percept is explained
+        by at least one adjacent entity, either a known one or one assigned
+        in the configuration. Consistency is checked locally against the
+        witnesses instead of querying the knowledge base per configuration.
+
+        Args:
+            component (list[tuple[int, int]]): The uncertain cells.
+            witnesses (set[tuple[int, int]]): Percept cells touching them.
+            entity_pos (set[tuple[int, int]]): Known entity positions.
+            entity_prob (float): The prior probability of an entity per cell.
+
+        Returns:
+            dict[tuple[int, int], float]: The posterior probability per cell.
+        """
+        index = {cell: i for i, cell in enumerate(component)}
+        k = len(component)
+
+        # Encode each witness as a bitmask over the component cells;
+        # witnesses already explained by a known entity impose no constraint
+        constraints = []
+        for witness in witnesses:
+            neighbors = set(self._neighbors(*witness))
+            if neighbors & entity_pos:
+                continue
+            mask = 0
+            for cell in neighbors:
+                if cell in index:
+                    mask |= 1 << index[cell]
+            constraints.append(mask)
+
+        if not constraints:
+            # Every witness is explained by a known entity, so nothing
+            # couples the cells and each keeps its prior
+            return {cell: entity_prob for cell in component}
+
+        total, true_sums = _enumerate_component(
+            k, constraints, _weight_table(k, entity_prob)
         )
-        for node in self._make_bayes_node(known_entities, percept_pos, percept_func, any=False):
-            bayes_net.add_node(node)
-            evidence[node.variable] = True
-
-        results = {}
-        for cell in cells - entity_pos:
-            var = entity_func(*cell).name
-            post = elimination_ask(var, evidence, bayes_net)
-            results[cell] = post[True]
-        return results
 
-    def _make_bayes_node(self, variables, frontier, entity_func, **kwargs):
-        nodes = []
-        func = any if kwargs.get("any", True) else all
-
-        for var in variables:
-            parents = []
-            _, x, y = var.split("_")
-            for cell in self._neighbors(int(x), int(y)):
-                if cell in frontier:
-                    parents.append(entity_func(*cell).name)
-            if not parents:
-                continue  # Skip if no parents
-            # Build CPT: if Percept is true, then entity is likely present
-            cpt = {}
-            for combo in product([True, False], repeat=len(parents)):
-                cpt[combo] = func(combo)
-            nodes.append(BayesNode(var, parents, cpt))
-
-        return nodes
+        if total <= 0:  # No consistent configuration, fall back to the prior
+            return {cell: entity_prob for cell in component}
+        return {cell: true_sums[i] / total for cell, i in index.items()}
+
+
+def _signature_proves_safe(signature):
+    """Check whether a percept signature alone proves a cell safe.
+
+    A breeze-free visited neighbor rules out a pit and a stench-free one
+    rules out a wumpus, both by the local percept axioms. Only a safety
+    label backed by both is independent of the rest of the board and may
+    be replayed for any cell sharing the signature.
+
+    Args:
+        signature (tuple): Entries of (dx, dy, breeze, stench) for the
+            visited neighbors, as built by _percept_signature.
+
+    Returns:
+        bool: True if the signature itself entails the cell is safe.
+    """
+    return (
+        any(entry[2] is False for entry in signature)
+        and any(entry[3] is False for entry in signature)
+    )
+
+
+_WEIGHT_TABLES = {}
+
+
+def _weight_table(k, entity_prob):
+    """Get the configuration weight per popcount for a component of k cells.
+
+    The weight of a configuration depends only on how many cells it marks
+    as holding the entity, so the table is a pure function of (k, prior)
+    and is shared across components, ticks and agent instances. Each entry
+    takes one multiply: W[c] = p**c * (1-p)**(k-c) = W[c-1] * p / (1-p).
+
+    Args:
+        k (int): The number of cells in the component.
+        entity_prob (float): The prior probability of an entity per cell.
+
+    Returns:
+        list[float]: The configuration weight indexed by popcount.
+    """
+    key = (k, entity_prob)
+    weights = _WEIGHT_TABLES.get(key)
+    if weights is None:
+        if entity_prob >= 1.0:
+            weights = [0.0] * k + [1.0]
+        else:
+            ratio = entity_prob / (1 - entity_prob)
+            weights = [(1 - entity_prob) ** k]
+            for count in range(1, k + 1):
+                weights.append(weights[count - 1] * ratio)
+        _WEIGHT_TABLES[key] = weights
+    return weights
+
+
+def _enumerate_component(k, constraints, weights):
+    """Sum consistent configuration weights for one constraint component.
+
+    This is the enumeration kernel of _component_probability, kept as a
+    module-level function over plain integers and lists so the hot loop
+    touches only locals. Per-cell sums iterate just the set bits of each
+    configuration instead of all k positions.
+
+    Args:
+        k (int): The number of cells in the component.
+        constraints (list[int]): One bitmask per unexplained witness.
+        weights (list[float]): Configuration weight per popcount.
+
+    Returns:
+        tuple[float, list[float]]: The total weight of consistent
+            configurations and the per-cell weight of those with the
+            cell's bit set.
+    """
+    total = 0.0
+    true_sums = [0.0] * k
+    for config in range(1 << k):
+        satisfied = True
+        for mask in constraints:
+            if not config & mask:
+                satisfied = False
+                break
+        if not satisfied:
+            continue
+        weight = weights[config.bit_count()]
+        total += weight
+        bits = config
+        while bits:
+            low = bits & -bits
+            true_sums[low.bit_length() - 1] += weight
+            bits ^= low
+    return total, true_sums
@@ -1,4 +1,6 @@
 from random import choice
+
+from modules.planning import RoutePlanner
 from .hybrid_agent import HybridAgent
 
 
@@ -13,10 +15,17 @@ class RandomAgent(HybridAgent):
 
         goal = choice(list(goals)) if isinstance(goals, (list, set)) else goals
 
-        from modules.planning import RoutePlanner
         planner = RoutePlanner(current, goal, allowed, self.size)
         return planner.plan_route()
 
+    def plan_route_any(self, current, goal_sets, allowed):
+        """Plans a route to the first goal set that yields a plan"""
+        for index, goals in enumerate(goal_sets):
+            actions = self.plan_route(current, goals, allowed)
+            if actions:
+                return actions, index
+        return [], -1
+
     def plan_uncertain(self, current, risk_positions, allowed):
         """Plans a route considering uncertain positions"""
         return self.plan_route(current, risk_positions, allowed)
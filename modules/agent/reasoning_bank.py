@@ -0,0 +1,127 @@
+import atexit
+import pickle
+from collections import OrderedDict
+from pathlib import Path
+
+
+class ReasoningBank:
+    """A persistent cache of derived cell classifications.
+
+    Safety labels derived by the knowledge base recur: a frontier cell
+    surrounded by the same local percepts is classified the same way, both
+    across ticks and across runs. The bank memoizes those classifications
+    keyed by a canonical local-percept signature, so a hit skips the
+    knowledge-base derivation entirely.
+
+    Only safe labels (True) are banked. A hazard or "unknown" label can
+    rest on knowledge outside the cell's local signature — for example a
+    breeze witness whose other neighbors are known safe elsewhere on the
+    board — so replaying it for another cell that merely shares the
+    signature would be unsound. A safe label is banked only when the
+    signature itself proves it, which the caller is responsible for
+    checking.
+
+    Attributes:
+        path (Path): The file the bank is persisted to between runs.
+        max_size (int): The maximum number of signatures kept (LRU bound).
+    """
+
+    _instances: dict = {}
+
+    @classmethod
+    def open(cls, path=None, max_size=4096):
+        """Get the shared bank for a path, creating it on first use.
+
+        Agents come and go within one process (the UI builds a new one
+        per game), so they share a single bank per file instead of each
+        loading the file and registering their own exit-time save.
+
+        Args:
+            path (str | Path, optional): Where to persist the bank.
+                Defaults to ~/.wumpus_reasoning.pkl.
+            max_size (int, optional): LRU capacity. Defaults to 4096.
+
+        Returns:
+            ReasoningBank: The shared bank for the path.
+        """
+        resolved = Path(path) if path else Path.home() / \
+            ".wumpus_reasoning.pkl"
+        bank = cls._instances.get(resolved)
+        if bank is None:
+            bank = cls(resolved, max_size)
+            cls._instances[resolved] = bank
+        return bank
+
+    def __init__(self, path=None, max_size=4096):
+        """Initializes the ReasoningBank.
+
+        Args:
+            path (str | Path, optional): Where to persist the bank.
+                Defaults to ~/.wumpus_reasoning.pkl.
+            max_size (int, optional): LRU capacity. Defaults to 4096.
+        """
+        self.path = Path(path) if path else Path.home() / \
+            ".wumpus_reasoning.pkl"
+        self.max_size = max_size
+        self._entries: OrderedDict = OrderedDict()
+        self._dirty = False
+
+        self._load()
+        atexit.register(self.save)
+
+    def get(self, signature):
+        """Look up the banked label for a percept signature.
+
+        Args:
+            signature (tuple): A canonical local-percept signature.
+
+        Returns:
+            bool | None: The banked label, or None on a miss.
+        """
+        label = self._entries.get(signature)
+        if label is not None:
+            self._entries.move_to_end(signature)
+        return label
+
+    def put(self, signature, label):
+        """Bank a safe label for a percept signature.
+
+        Args:
+            signature (tuple): A canonical local-percept signature.
+            label (bool | None): The derived label; anything other than
+                True is not banked (see the class docstring).
+        """
+        if label is not True:
+            return
+        self._entries[signature] = label
+        self._entries.move_to_end(signature)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        self._dirty = True
+
+    def save(self):
+        """Persist the bank to disk if it changed since the last save."""
+        if not self._dirty:
+            return
+        try:
+            with open(self.path, "wb") as file:
+                pickle.dump(self._entries, file)
+            self._dirty = False
+        except OSError:
+            pass  # Persistence is best-effort only
+
+    def _load(self):
+        """Load a previously persisted bank, if one exists."""
+        try:
+            with open(self.path, "rb") as file:
+                entries = pickle.load(file)
+            if isinstance(entries, OrderedDict):
+                # Files written before hazard labels were dropped may
+                # still hold them; keep only the sound safe entries
+                self._entries = OrderedDict(
+                    (signature, label)
+                    for signature, label in entries.items()
+                    if label is True
+                )
+        except (OSError, pickle.PickleError, EOFError):
+            pass  # Start empty if the file is missing or unreadable
@@ -7,8 +7,12 @@ class Thing:
 
     Attributes:
         location: The location of the thing in the environment.
+        has_position (bool): Whether the thing carries a full Position
+            (coordinates plus orientation) that must be kept in sync
+            with its location.
     """
     location = None
+    has_position = False
 
     def __repr__(self):
         """Return a string representation of the Thing."""
@@ -57,13 +61,18 @@ class Agent(Thing):
 class Explorer(Agent):
     """An agent that explores the Wumpus World.
 
+    The arrow and gold inventory is tracked as two plain flags; the
+    `holding` set from Agent is kept as a view built on demand, since the
+    only questions ever asked of it are "is there an arrow" and "is there
+    gold".
+
     Attributes:
         position (Position): The agent's current position and orientation.
-        holding (set[Thing]): The set of things the agent is holding.
         killed_by (str): The name of the thing that killed the agent.
         visited (set): A set of locations the agent has visited.
         in_world (bool): Whether the agent is still in the world.
     """
+    has_position = True
 
     def __init__(self, program=None):
         """Initializes an Explorer agent.
@@ -73,30 +82,42 @@ class Explorer(Agent):
         """
         super().__init__(program)
         self.position = Position()  # Default position at (0, 0) facing East
-        self.holding: set[Thing] = {Arrow()}
+        self._has_arrow = True  # Explorers start with one arrow
+        self._has_gold = False
         self.killed_by = ""
         self.visited = set()
         self.in_world = True
 
+    @property
+    def holding(self):
+        """set[Thing]: A view of the things the agent is holding."""
+        held: set[Thing] = set()
+        if self._has_arrow:
+            held.add(Arrow())
+        if self._has_gold:
+            held.add(Gold())
+        return held
+
+    @holding.setter
+    def holding(self, things):
+        """Sets the inventory flags from an iterable of things."""
+        self._has_arrow = any(isinstance(thing, Arrow) for thing in things)
+        self._has_gold = any(isinstance(thing, Gold) for thing in things)
+
     @property
     def has_arrow(self):
         """bool: True if the agent is holding an arrow."""
-        return any(isinstance(thing, Arrow) for thing in self.holding)
+        return self._has_arrow
 
     @has_arrow.setter
     def has_arrow(self, value):
         """Sets the agent's arrow status."""
-        if value:
-            self.holding.add(Arrow())
-        else:
-            self.holding = {
-                thing for thing in self.holding if not isinstance(thing, Arrow)
-            }
+        self._has_arrow = bool(value)
 
     @property
     def has_gold(self):
         """bool: True if the agent is holding gold."""
-        return any(isinstance(thing, Gold) for thing in self.holding)
+        return self._has_gold
 
     def grab_gold(self, thing):
         """Grab gold if present at the agent's location.
@@ -104,7 +125,8 @@ class Explorer(Agent):
         Args:
             thing (Thing): The thing to grab.
         """
-        self.holding.add(thing) if isinstance(thing, Gold) else None
+        if isinstance(thing, Gold):
+            self._has_gold = True
 
 
 class Wumpus(Agent):
@@ -113,8 +135,15 @@ class Wumpus(Agent):
     Attributes:
         screamed (bool): Whether the Wumpus has screamed (after being killed).
     """
-    screamed = False
-    pass
+
+    def __init__(self, program=None):
+        """Initializes a Wumpus.
+
+        Args:
+            program (Callable, optional): The Wumpus's program.
+        """
+        super().__init__(program)
+        self.screamed = False
 
 
 class SmartWumpus(Wumpus):
@@ -123,12 +152,14 @@ class SmartWumpus(Wumpus):
     def __init__(self):
         """Initializes a SmartWumpus."""
         super().__init__(self.execute)
+        self._move_cooldown = 6  # First move falls on the fifth time step
 
     def execute(self, percept, time):
         """The Smart Wumpus's action program.
 
         The Wumpus will kill an explorer in the same location, or move
-        periodically.
+        periodically. The movement period is kept by a countdown instead
+        of a modulo on the global time.
 
         Args:
             percept (dict): The current percepts for the Wumpus.
@@ -137,11 +168,13 @@ class SmartWumpus(Wumpus):
         Returns:
             Action: The action to be taken by the Wumpus.
         """
+        self._move_cooldown -= 1
         if percept.get("explorer", False):
             return Action.KILL
 
-        if time > 0 and time % 5 == 0:
-            return Action.MOVE  # Wumpus can move every 5 time steps
+        if self._move_cooldown <= 0:
+            self._move_cooldown = 5  # Wumpus can move every 5 time steps
+            return Action.MOVE
 
         return Action.NOOP  # No operation if no action is needed
 
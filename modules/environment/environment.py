@@ -4,6 +4,10 @@ from random import randint
 from modules.utils import Action
 from .entity import Agent, Thing
 
+# Offsets of the four non-diagonal neighbors, shared by every
+# neighborhood query instead of being rebuilt per call.
+_NEIGHBOR_OFFSETS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
 
 class Environment(ABC):
     """Abstract base class for an environment.
@@ -28,6 +32,21 @@ class Environment(ABC):
         """
         self.things = []
         self.agents = []
+        # Location index: maps a location to the (small) list of things
+        # currently on it, so lookups by cell do not scan every thing in
+        # the world. Kept in sync by add_thing, remove_thing and move_to.
+        self._things_by_location: dict[tuple[int, int], list[Thing]] = {}
+        # Position of each thing/agent in its list, keyed by identity, so
+        # membership checks and removals need no linear scan.
+        self._thing_index: dict[int, int] = {}
+        self._agent_index: dict[int, int] = {}
+        # Bumped on every successful add, removal or move, so derived
+        # views of the world can tell whether they are stale.
+        self._world_version = 0
+        # While a step is executing actions, removals are parked here and
+        # applied afterwards, so the agents list stays stable during the
+        # action loop. None outside of a step (removals apply at once).
+        self._deferred_removals = None
         self.width, self.height = width, height
         # Define the bounds of the environment
         self._x_start, self._y_start = 0, 0
@@ -98,10 +117,15 @@ class Environment(ABC):
             else:
                 actions.append(Action.NOOP)
 
-        agents = [*self.agents]
-        for agent, action in zip(agents, actions):
+        # Defer removals until every action has run, so the agents list
+        # does not change under the loop and needs no per-step copy.
+        self._deferred_removals = removals = []
+        for agent, action in zip(self.agents, actions):
             if action is not Action.NOOP:
                 self.execute_action(agent, action)
+        self._deferred_removals = None
+        for thing in removals:
+            self.remove_thing(thing)
 
         self.time += 1  # Increment time after all actions are executed
 
@@ -126,10 +150,11 @@ class Environment(ABC):
         Returns:
             tuple[int, int]: A random (x, y) location.
         """
+        excluded = set(exclude) if exclude is not None else ()
         while True:
             x = randint(self._x_start, self._x_end)
             y = randint(self._y_start, self._y_end)
-            if exclude is None or (x, y) not in exclude:
+            if (x, y) not in excluded:
                 return x, y
 
     def add_thing(self, thing, location, replace=False):
@@ -151,9 +176,13 @@ class Environment(ABC):
         if not replace and self._some_things_at(location):
             return False
 
+        self._thing_index[id(thing)] = len(self.things)
         self.things.append(thing)
+        self._things_by_location.setdefault(location, []).append(thing)
         if isinstance(thing, Agent):
+            self._agent_index[id(thing)] = len(self.agents)
             self.agents.append(thing)
+        self._world_version += 1
         return True
 
     def remove_thing(self, thing):
@@ -165,14 +194,42 @@ class Environment(ABC):
         Returns:
             bool: True if the thing was removed successfully, False otherwise.
         """
-        if thing not in self.things:
+        if id(thing) not in self._thing_index:
             return False  # Ensure the thing is in the environment
 
-        self.things.remove(thing)
+        if self._deferred_removals is not None:
+            self._deferred_removals.append(thing)
+            return True
+
+        self._pop_from(self.things, self._thing_index, thing)
+        bucket = self._things_by_location.get(thing.location)
+        if bucket is not None:
+            bucket.remove(thing)
+            if not bucket:
+                del self._things_by_location[thing.location]
         if isinstance(thing, Agent):
-            self.agents.remove(thing)
+            self._pop_from(self.agents, self._agent_index, thing)
+        self._world_version += 1
         return True
 
+    @staticmethod
+    def _pop_from(items, index, thing):
+        """Remove a thing from a list in O(1) using its identity index.
+
+        The last element is swapped into the removed thing's slot, so
+        the list order is not preserved — no caller depends on it.
+
+        Args:
+            items (list): The list to remove from.
+            index (dict[int, int]): The id -> position map for the list.
+            thing (Thing): The thing to remove.
+        """
+        position = index.pop(id(thing))
+        last = items.pop()
+        if last is not thing:
+            items[position] = last
+            index[id(last)] = position
+
     def things_near(self, location):
         """Get all things in adjacent (non-diagonal) squares to the location.
 
@@ -183,9 +240,12 @@ class Environment(ABC):
             list[Thing]: A list of things in the neighboring squares.
         """
         x, y = location
-        near_location = [(x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)]
-
-        return [thing for thing in self.things if thing.location in near_location]
+        buckets = self._things_by_location
+        return [
+            thing
+            for dx, dy in _NEIGHBOR_OFFSETS
+            for thing in buckets.get((x + dx, y + dy), ())
+        ]
 
     def move_to(self, thing, destination, obstacle_types=None):
         """Move a thing to the specified destination.
@@ -207,9 +267,18 @@ class Environment(ABC):
             thing.bump = True
 
         if not thing.bump:
+            origin = thing.location
             thing.location = destination
-            if hasattr(thing, 'position'):
+            bucket = self._things_by_location.get(origin)
+            if bucket is not None and thing in bucket:
+                bucket.remove(thing)
+                if not bucket:
+                    del self._things_by_location[origin]
+                self._things_by_location.setdefault(
+                    destination, []).append(thing)
+            if thing.has_position:
                 thing.position.location = destination
+            self._world_version += 1
         return thing.bump
 
     def _list_things_at(self, location, thing_type=Thing):
@@ -223,8 +292,8 @@ class Environment(ABC):
         Returns:
             list[Thing]: A list of things of the specified type at the location.
         """
-        return [thing for thing in self.things
-                if thing.location == location and isinstance(thing, thing_type)]
+        return [thing for thing in self._things_by_location.get(location, ())
+                if isinstance(thing, thing_type)]
 
     def _some_things_at(self, location, thing_type=Thing):
         """Check if there is at least one thing of a given type at a location.
@@ -237,4 +306,7 @@ class Environment(ABC):
         Returns:
             bool: True if at least one thing of the type is found, False otherwise.
         """
-        return any(self._list_things_at(location, thing_type))
+        return any(
+            isinstance(thing, thing_type)
+            for thing in self._things_by_location.get(location, ())
+        )
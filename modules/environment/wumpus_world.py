@@ -1,6 +1,6 @@
 import random
 from typing import Iterator
-from modules.utils import Action
+from modules.utils import Action, Orientation
 from .environment import Environment
 from .entity import Explorer, Gold, Pit, Wumpus, Thing
 
@@ -32,6 +32,30 @@ class WumpusWorld(Environment):
         """
         super().__init__(size, size)
         self.wumpus_program = kwargs.get("wumpus_program", Wumpus)
+
+        # Percept neighborhoods, built lazily on first use. Pits never
+        # move, so the breeze set lives for the whole game; the stench set
+        # is invalidated whenever a wumpus moves or dies.
+        self._breeze_cells = None
+        self._stench_cells = None
+
+        # Wumpus roster, built lazily after the world is populated. A dead
+        # wumpus stays in the world (only its alive flag flips), so the
+        # list never needs invalidating.
+        self._wumpus_list = None
+
+        # Cached get_world grid and the world version it was built for.
+        self._world_grid = None
+        self._world_grid_version = None
+
+        # Number of wumpus deaths not yet announced by a scream, so the
+        # percept loop can skip the roster scan on quiet steps.
+        self._pending_screams = 0
+
+        # Explorer roster, maintained eagerly by add_thing/remove_thing
+        # so is_done need not filter the agents list every call.
+        self._explorer_roster = []
+
         if things := kwargs.get("things", None):
             self.init_world_from_map(things)
         else:
@@ -45,31 +69,36 @@ class WumpusWorld(Environment):
             k_wumpus (int): The number of Wumpuses.
             pit_density (float): The density of pits.
         """
-        pit_locations = []
-        wumpus_locations = []
+        # Sample hazard locations from the pool of still-free cells, so
+        # every draw succeeds instead of re-rolling already taken cells.
+        # The start cell and its neighbors stay clear of hazards. The pool
+        # is kept sorted so draws depend only on the random seed.
+        free = sorted(
+            (x, y)
+            for x in range(self.width)
+            for y in range(self.height)
+            if (x, y) not in ((0, 0), (1, 0), (0, 1))
+        )
 
         # Spawn pits in the environment
         num_pits = int(self.width * self.height * pit_density)
-        while len(pit_locations) < num_pits:
-            location = self.random_location(
-                exclude=[(0, 0), (1, 0), (0, 1)]
-            )
-
-            if self.add_thing(Pit(), location):
-                pit_locations.append(location)
+        pit_locations = random.sample(free, num_pits)
+        for location in pit_locations:
+            self.add_thing(Pit(), location)
 
         # Spawn wumpuses in the environment
-        while len(wumpus_locations) < k_wumpus:
-            location = self.random_location(
-                exclude=[(0, 0), (1, 0), (0, 1), *pit_locations]
-            )
-            if self.add_thing(self.wumpus_program(), location):
-                wumpus_locations.append(location)
-
-        # Spawn gold in the environment.
-        gold_location = self.random_location(
-            exclude=[*pit_locations, *wumpus_locations]
-        )
+        taken = set(pit_locations)
+        free = [location for location in free if location not in taken]
+        wumpus_locations = random.sample(free, k_wumpus)
+        for location in wumpus_locations:
+            self.add_thing(self.wumpus_program(), location)
+
+        # Spawn gold in the environment. Unlike the hazards, gold may
+        # share a cell with the start-adjacent squares.
+        taken = set(wumpus_locations)
+        free = [location for location in free if location not in taken]
+        free.extend(((0, 0), (1, 0), (0, 1)))
+        gold_location = random.choice(free)
         self.add_thing(Gold(), gold_location)
 
         # Spawn the agent in the environment.
@@ -79,6 +108,43 @@ class WumpusWorld(Environment):
         else:
             self.add_thing(agent_program, (0, 0), replace=True)
 
+    def add_thing(self, thing, location, replace=False):
+        """Add a thing to the world, tracking explorers as they arrive.
+
+        Args:
+            thing (Thing): The thing to add.
+            location (tuple[int, int]): The location to add the thing at.
+            replace (bool, optional): If True, replaces any existing thing
+                at the location. Defaults to False.
+
+        Returns:
+            bool: True if the thing was added successfully, False otherwise.
+        """
+        added = super().add_thing(thing, location, replace)
+        if added and isinstance(thing, Explorer):
+            self._explorer_roster.append(thing)
+        return added
+
+    def remove_thing(self, thing):
+        """Remove a thing from the world, tracking explorers as they leave.
+
+        Args:
+            thing (Thing): The thing to remove.
+
+        Returns:
+            bool: True if the thing was removed successfully, False otherwise.
+        """
+        removed = super().remove_thing(thing)
+        # A removal requested mid-step is parked by the base class and
+        # replayed afterwards; update the roster only on the real one.
+        if (
+            removed
+            and self._deferred_removals is None
+            and isinstance(thing, Explorer)
+        ):
+            self._explorer_roster.remove(thing)
+        return removed
+
     def init_world_from_map(self, things: list[tuple[Thing, tuple[int, int]]]):
         """Initialize the world with a predefined list of things.
 
@@ -92,18 +158,79 @@ class WumpusWorld(Environment):
     def get_world(self) -> Iterator[list[list[Thing]]]:
         """Return the items in the Wumpus World as a 2D grid.
 
+        The grid is rebuilt only when something has been added, removed
+        or moved since the last call; unchanged worlds reuse the cached
+        grid. Callers must treat the returned rows as read-only.
+
         Returns:
             Iterator[list[list[Thing]]]: An iterator over the rows of the world grid.
         """
-        world = [
-            [[] for _ in range(self._x_start, self._x_end + 1)]
-            for _ in range(self._y_start, self._y_end + 1)
-        ]
-        for thing in self.things:
-            y, x = thing.location
-            if self.is_inbounds((x, y)):
-                world[x - self._x_start][y - self._y_start].append(thing)
-        return reversed(world)
+        if self._world_grid_version != self._world_version:
+            world = [
+                [[] for _ in range(self._x_start, self._x_end + 1)]
+                for _ in range(self._y_start, self._y_end + 1)
+            ]
+            for thing in self.things:
+                y, x = thing.location
+                if self.is_inbounds((x, y)):
+                    world[x - self._x_start][y - self._y_start].append(thing)
+            self._world_grid = world
+            self._world_grid_version = self._world_version
+        return reversed(self._world_grid)
+
+    def _wumpuses(self):
+        """Get the wumpuses in the world, dead or alive.
+
+        Wumpuses are only ever added while the world is being populated,
+        so the roster is collected once on first use and reused by every
+        percept and arrow shot afterwards.
+
+        Returns:
+            list[Wumpus]: The wumpuses in the world.
+        """
+        if self._wumpus_list is None:
+            self._wumpus_list = [
+                thing for thing in self.things if isinstance(thing, Wumpus)
+            ]
+        return self._wumpus_list
+
+    def _breeze_locations(self):
+        """Get the set of locations where a breeze is perceived.
+
+        Pits never move, so the neighborhood union is computed once on
+        first use and reused for every percept afterwards.
+
+        Returns:
+            set[tuple[int, int]]: The locations adjacent to a pit.
+        """
+        if self._breeze_cells is None:
+            self._breeze_cells = set()
+            for thing in self.things:
+                if isinstance(thing, Pit):
+                    x, y = thing.location
+                    self._breeze_cells.update(
+                        ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1))
+                    )
+        return self._breeze_cells
+
+    def _stench_locations(self):
+        """Get the set of locations where a stench is perceived.
+
+        Rebuilt lazily after a wumpus moves or dies (the mutating actions
+        reset the cache to None).
+
+        Returns:
+            set[tuple[int, int]]: The locations adjacent to a live wumpus.
+        """
+        if self._stench_cells is None:
+            self._stench_cells = set()
+            for wumpus in self._wumpuses():
+                if wumpus.alive:
+                    x, y = wumpus.location
+                    self._stench_cells.update(
+                        ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1))
+                    )
+        return self._stench_cells
 
     def percept(self, agent):
         """Get the percept for the given agent.
@@ -117,30 +244,26 @@ class WumpusWorld(Environment):
         Returns:
             dict[str, bool]: A dictionary of percepts.
         """
-        things_near = self.things_near(agent.location)
-
         percepts: dict[str, bool] = {
-            "breeze": any(isinstance(thing, Pit) for thing in things_near),
-            "stench": any(
-                isinstance(thing, Wumpus) and thing.alive for thing in things_near
-            ),
+            "breeze": agent.location in self._breeze_locations(),
+            "stench": agent.location in self._stench_locations(),
         }
 
-        # Check for bump (if agent bumped into a wall)
-        percepts["bump"] = agent.bump if hasattr(agent, "bump") else False
+        # Check for bump (if agent bumped into a wall); every Agent sets
+        # the flag in __init__, so no attribute probe is needed
+        percepts["bump"] = agent.bump
 
         # Check for glitter (gold) only at the agent's location
         if any(self._list_things_at(agent.location, Gold)):
             percepts["glitter"] = True
 
         # Check for scream (wumpus death) with Explorer
-        if isinstance(agent, Explorer):
-            wumpuses = [
-                thing for thing in self.things if isinstance(thing, Wumpus)]
-            for wumpus in wumpuses:
+        if isinstance(agent, Explorer) and self._pending_screams:
+            for wumpus in self._wumpuses():
                 if not wumpus.alive and not wumpus.screamed:
                     percepts["scream"] = True
                     wumpus.screamed = True
+            self._pending_screams = 0
 
         if not isinstance(agent, Wumpus):
             return percepts
@@ -158,7 +281,9 @@ class WumpusWorld(Environment):
         """Execute the given action for the specified agent.
 
         Handles actions for both Explorer and Wumpus agents, updating the
-        agent's state and the environment accordingly.
+        agent's state and the environment accordingly. Dispatch goes
+        through a precomputed handler table instead of an if/elif walk
+        over the action types.
 
         Args:
             agent (Agent): The agent performing the action.
@@ -168,59 +293,117 @@ class WumpusWorld(Environment):
             return
 
         agent.bump = False
-        if action == Action.FORWARD:
-            new_location = Action.forward(agent.position).location
-            agent.bump = self.move_to(agent, new_location)
-            agent.performance -= 1
-        elif action == Action.TURN_LEFT:
-            agent.position = Action.turn_left(agent.position)
-            agent.performance -= 1
-        elif action == Action.TURN_RIGHT:
-            agent.position = Action.turn_right(agent.position)
-            agent.performance -= 1
-        elif action == Action.GRAB:  # Only triggered when gold at agent's location
-            if self._some_things_at(agent.position.location, Gold):
-                agent.grab_gold(Gold())
-                self.things = [
-                    thing for thing in self.things if not isinstance(thing, Gold)
-                ]
-            agent.performance += 10 if agent.has_gold else 0
-        elif action == Action.CLIMB:
-            if agent.location == (0, 0):
-                agent.performance += 1000 if agent.has_gold else 0
-                agent.in_world = False
-                self.remove_thing(agent)
-        elif action == Action.SHOOT:
-            if agent.has_arrow:
-                arrow_travel = Action.forward(agent.position)
-                while self.is_inbounds(arrow_travel.location):
-                    wumpus = self._list_things_at(
-                        arrow_travel.location, Wumpus)
-                    if wumpus:
-                        wumpus[0].alive = False  # type: ignore
-                        print(
-                            f"Wumpus at {arrow_travel.location} has been killed!")
-                        break
-                    arrow_travel = Action.forward(arrow_travel)
-                agent.has_arrow = False
-                agent.performance -= 10
-
-        # ========== WUMPUS ACTIONS ========== #
-        elif action == Action.KILL:  # Only triggered when Explorer at Wumpus location
-            list_things_at = self._list_things_at(agent.location)
-            for thing in list_things_at:
-                if isinstance(thing, Explorer) and thing.alive:
-                    thing.alive = False
-                    thing.killed_by = "Wumpus"
-                    thing.performance -= 1000
-
-        elif action == Action.MOVE:  # Move Wumpus randomly
-            direction = random.choice([(0, 1), (1, 0), (0, -1), (-1, 0)])
-            new_location = (
-                agent.location[0] + direction[0],  # type: ignore
-                agent.location[1] + direction[1],  # type: ignore
-            )  # type: ignore
-            agent.bump = self.move_to(agent, new_location, (Pit, Wumpus))
+        handler = self._ACTION_HANDLERS.get(action)
+        if handler is not None:
+            handler(self, agent)
+
+    def _do_forward(self, agent):
+        """Move the agent one cell in its facing direction."""
+        new_location = Action.forward(agent.position).location
+        agent.bump = self.move_to(agent, new_location)
+        agent.performance -= 1
+
+    def _do_turn_left(self, agent):
+        """Turn the agent 90 degrees to the left."""
+        agent.position = Action.turn_left(agent.position)
+        agent.performance -= 1
+
+    def _do_turn_right(self, agent):
+        """Turn the agent 90 degrees to the right."""
+        agent.position = Action.turn_right(agent.position)
+        agent.performance -= 1
+
+    def _do_grab(self, agent):
+        """Grab the gold at the agent's location, if present."""
+        for gold_thing in self._list_things_at(agent.position.location, Gold):
+            agent.grab_gold(gold_thing)
+            self.remove_thing(gold_thing)
+        agent.performance += 10 if agent.has_gold else 0
+
+    def _do_climb(self, agent):
+        """Climb out of the world, only possible at the start cell."""
+        if agent.location == (0, 0):
+            agent.performance += 1000 if agent.has_gold else 0
+            agent.in_world = False
+            self.remove_thing(agent)
+
+    def _do_shoot(self, agent):
+        """Shoot the arrow in the agent's facing direction."""
+        if agent.has_arrow:
+            wumpus = self._first_wumpus_on_ray(agent.position)
+            if wumpus:
+                wumpus.alive = False
+                self._stench_cells = None  # Stench source died
+                self._pending_screams += 1
+                print(f"Wumpus at {wumpus.location} has been killed!")
+            agent.has_arrow = False
+            agent.performance -= 10
+
+    # ========== WUMPUS ACTIONS ========== #
+    def _do_kill(self, agent):
+        """Kill any live Explorer at the Wumpus's location."""
+        list_things_at = self._list_things_at(agent.location)
+        for thing in list_things_at:
+            # in_world filters an explorer that climbed out earlier in
+            # this same step but whose removal is still pending
+            if isinstance(thing, Explorer) and thing.alive and thing.in_world:
+                thing.alive = False
+                thing.killed_by = "Wumpus"
+                thing.performance -= 1000
+
+    def _do_move(self, agent):
+        """Move the Wumpus in a random direction."""
+        direction = random.choice([(0, 1), (1, 0), (0, -1), (-1, 0)])
+        new_location = (
+            agent.location[0] + direction[0],  # type: ignore
+            agent.location[1] + direction[1],  # type: ignore
+        )  # type: ignore
+        agent.bump = self.move_to(agent, new_location, (Pit, Wumpus))
+        self._stench_cells = None  # Stench source may have moved
+
+    _ACTION_HANDLERS = {
+        Action.FORWARD: _do_forward,
+        Action.TURN_LEFT: _do_turn_left,
+        Action.TURN_RIGHT: _do_turn_right,
+        Action.GRAB: _do_grab,
+        Action.CLIMB: _do_climb,
+        Action.SHOOT: _do_shoot,
+        Action.KILL: _do_kill,
+        Action.MOVE: _do_move,
+    }
+
+    def _first_wumpus_on_ray(self, position):
+        """Find the wumpus an arrow shot from the given position hits first.
+
+        The arrow flies in a straight line, so rather than stepping one
+        cell at a time and scanning the thing list at every cell, the
+        wumpuses on the shooter's row or column are compared by distance
+        directly. The arrow stops at the first wumpus it reaches, dead or
+        alive, matching the cell-by-cell walk it replaces.
+
+        Args:
+            position (Position): The shooter's position and orientation.
+
+        Returns:
+            Wumpus | None: The wumpus the arrow reaches first, if any.
+        """
+        x, y = position.location
+        orientation = position.get_orientation()
+
+        hit, hit_distance = None, None
+        for thing in self._wumpuses():
+            wx, wy = thing.location
+            if orientation == Orientation.EAST:
+                on_ray, distance = wy == y and wx > x, wx - x
+            elif orientation == Orientation.WEST:
+                on_ray, distance = wy == y and wx < x, x - wx
+            elif orientation == Orientation.NORTH:
+                on_ray, distance = wx == x and wy > y, wy - y
+            else:  # SOUTH
+                on_ray, distance = wx == x and wy < y, y - wy
+            if on_ray and (hit is None or distance < hit_distance):
+                hit, hit_distance = thing, distance
+        return hit
 
     def in_danger(self, agent):
         """Check if an Explorer is in a dangerous location and update its status.
@@ -252,12 +435,13 @@ class WumpusWorld(Environment):
         Returns:
             bool: True if the simulation is done, False otherwise.
         """
-        explorer = [
-            agent for agent in self.agents if isinstance(agent, Explorer)]
-        # Check if all explorers are dead or have climbed out
-        if explorer:
-            if all(self.in_danger(agent) or not agent.alive for agent in explorer):
-                return True
-            else:
-                return False
+        # Check if all explorers are dead or have climbed out. The
+        # in_danger call doubles as the hazard check that kills agents
+        # standing on a pit or live wumpus, so it must keep running here.
+        explorers = self._explorer_roster
+        if explorers:
+            return all(
+                self.in_danger(agent) or not agent.alive
+                for agent in explorers
+            )
         return True  # No explorers left, environment is done
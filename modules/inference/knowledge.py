@@ -1,6 +1,20 @@
 from .logic import Literal, Clause, wumpus, pit, glitter, scream, breeze, stench
 
 
+def _clause_sort_key(clause):
+    """Deterministic ordering key for the literals and clauses in tell().
+
+    Args:
+        clause (Literal | Clause): The clause to build a key for.
+
+    Returns:
+        tuple: A tuple of (sign, name) pairs comparing like the clause.
+    """
+    if isinstance(clause, Literal):
+        return ((clause.sign, clause.name),)
+    return tuple(sorted((lit.sign, lit.name) for lit in clause.literals))
+
+
 class KnowledgeBase:
     """A Knowledge Base for reasoning in the Wumpus World.
 
@@ -10,6 +24,7 @@ class KnowledgeBase:
     Attributes:
         size (int): The size of the Wumpus World grid.
         clauses (set[Clause]): The set of clauses in the knowledge base.
+        version (int): A counter incremented every time new clauses are told.
     """
 
     def __init__(self, size=8):
@@ -25,6 +40,40 @@ class KnowledgeBase:
             ~(wumpus(0, 0) | pit(0, 0) | glitter() | scream())
         )
 
+        # Version counter and query cache, so repeated queries between
+        # two tells can be answered without re-scanning the clauses.
+        self._version = 0
+        self._ask_cache: dict[frozenset[Literal], bool | None] = {}
+
+        # The literals currently known as unit clauses, kept current by
+        # infer() so queries need not wrap literals in throwaway clauses.
+        self._units: set[Literal] = {
+            c.unit() for c in self.clauses if c.is_unit()
+        }
+
+        # Neighbor table for the fixed grid, so adjacency queries are a
+        # single lookup, and a cache for the per-cell percept axioms,
+        # which are pure functions of the cell coordinates.
+        self._adj = {
+            (i, j): tuple(
+                (i + di, j + dj)
+                for di, dj in ((1, 0), (-1, 0), (0, 1), (0, -1))
+                if 0 <= i + di < size and 0 <= j + dj < size
+            )
+            for i in range(size)
+            for j in range(size)
+        }
+        self._axiom_cache: dict[tuple[int, int], frozenset[Clause]] = {}
+
+    @property
+    def version(self):
+        """int: The current version of the knowledge base.
+
+        The version is bumped whenever new clauses are added, so callers can
+        detect that previously derived results may be stale.
+        """
+        return self._version
+
     def __iter__(self):
         """Iterate over the clauses in the knowledge base."""
         return iter(self.clauses)
@@ -56,7 +105,10 @@ class KnowledgeBase:
             )
 
         unit_clauses = set()
-        clauses = sorted(clauses, key=lambda c: repr(c))
+        # Callers hand over sets, so impose a deterministic order before
+        # the contradiction handling below. The key mirrors the literal
+        # tuples directly instead of building display strings.
+        clauses = sorted(clauses, key=_clause_sort_key)
         for clause in clauses:
             new = Clause(clause) if isinstance(clause, Literal) else clause
             # Remove negated clauses if they already exist,
@@ -72,6 +124,10 @@ class KnowledgeBase:
         # to the knowledge base, so they can be used for inference.
         self.clauses = self.clauses.union(unit_clauses)
 
+        # Invalidate cached query results, the knowledge base has changed
+        self._version += 1
+        self._ask_cache.clear()
+
         self.infer()
 
     def tell_percept(self, i, j, percepts: dict[str, bool]):
@@ -86,21 +142,71 @@ class KnowledgeBase:
             j (int): The column of the agent's location.
             percepts (dict[str, bool]): A dictionary of percepts and their values.
         """
+        self.tell(*self._visit_clauses(i, j, percepts))
+
+    def observe(self, i, j, percepts: dict[str, bool]):
+        """Record a visit to cell (i, j) as a single batched tell.
+
+        Combines the percept clauses with the fact that the visited cell
+        holds neither a wumpus nor a pit, so the version bump, cache
+        invalidation and inference fixpoint run once instead of twice.
+
+        Args:
+            i (int): The row of the agent's location.
+            j (int): The column of the agent's location.
+            percepts (dict[str, bool]): A dictionary of percepts and their values.
+        """
+        clauses = self._visit_clauses(i, j, percepts)
+        clauses.add(~wumpus(i, j))
+        clauses.add(~pit(i, j))
+        self.tell(*clauses)
+
+    def _visit_clauses(self, i, j, percepts: dict[str, bool]):
+        """Collect the clauses a visit to cell (i, j) contributes.
+
+        Args:
+            i (int): The row of the cell.
+            j (int): The column of the cell.
+            percepts (dict[str, bool]): A dictionary of percepts and their values.
+
+        Returns:
+            set[Clause]: The percept clauses plus the breeze/stench axioms
+                for the cell and its neighbors.
+        """
         # 1) Create the clauses based on the percepts
         clauses = self._make_percept_clauses(i, j, percepts)
 
         # 2) Add the Breeze and Stench axioms for the current cell
-        clauses.update(self._breeze_axioms(i, j))
-        clauses.update(self._stench_axioms(i, j))
+        clauses.update(self._cell_axioms(i, j))
 
         # 3) Add the clauses for adjacent cells
         for x, y in self._adjacent(i, j):
-            clauses.update(self._breeze_axioms(x, y))
-            clauses.update(self._stench_axioms(x, y))
+            clauses.update(self._cell_axioms(x, y))
             clauses.add(~wumpus(x, y) | ~pit(x, y))
 
-        # 4) Add the clauses to the knowledge base
-        self.tell(*clauses)
+        return clauses
+
+    def _cell_axioms(self, i, j):
+        """Get the Breeze and Stench axioms for a cell, cached.
+
+        The axioms depend only on the cell coordinates and the fixed
+        grid, so they are generated once per cell and reused on every
+        later visit to the cell or its neighbors.
+
+        Args:
+            i (int): The row of the cell.
+            j (int): The column of the cell.
+
+        Returns:
+            frozenset[Clause]: The axiom clauses for the cell.
+        """
+        axioms = self._axiom_cache.get((i, j))
+        if axioms is None:
+            axioms = frozenset(
+                (*self._breeze_axioms(i, j), *self._stench_axioms(i, j))
+            )
+            self._axiom_cache[(i, j)] = axioms
+        return axioms
 
     def ask_if_true(self, query: list[Literal]):
         """Check if a query can be resolved as true from the knowledge base.
@@ -115,57 +221,133 @@ class KnowledgeBase:
             bool | None: True if all literals are known to be true, False if any
                          are known to be false, and None otherwise.
         """
-        if all(Clause(lit) in self.clauses for lit in query):
-            return True
+        # The cache is cleared on every tell, so entries never span
+        # versions and the key only needs the query itself
+        key = frozenset(query)
+        if key in self._ask_cache:
+            return self._ask_cache[key]
 
-        if any(~Clause(lit) in self.clauses for lit in query):
-            return False
+        if all(lit in self._units for lit in query):
+            result = True
+        elif any(~lit in self._units for lit in query):
+            result = False
+        else:
+            result = None
 
-        return None
+        self._ask_cache[key] = result
+        return result
 
-    def infer(self):
-        """Perform inference by repeatedly applying unit propagation.
+    def classify_cells(self, cells):
+        """Classify cells by their known contents in a single pass.
 
-        This method simplifies the knowledge base by using unit clauses to resolve
-        other clauses. This process is repeated until no more simplifications
-        can be made.
+        Instead of asking one query per cell — each of which re-wraps its
+        literals in unit clauses — every cell is classified against the
+        maintained unit-literal set.
+
+        Args:
+            cells: An iterable of (x, y) cells to classify.
+
+        Returns:
+            dict[tuple[int, int], str]: For each cell one of "wumpus",
+                "pit", "safe" or "unknown".
+        """
+        units = self._units
+
+        classification = {}
+        for cell in cells:
+            w, p = wumpus(*cell), pit(*cell)
+            if w in units:
+                classification[cell] = "wumpus"
+            elif p in units:
+                classification[cell] = "pit"
+            elif ~w in units and ~p in units:
+                classification[cell] = "safe"
+            else:
+                classification[cell] = "unknown"
+        return classification
+
+    def infer(self):
+        """Perform inference by propagating unit clauses to a fixpoint.
+
+        Instead of re-simplifying every clause against the unit model and
+        recursing until nothing changes, the non-unit clauses are indexed
+        by the literals they contain and a worklist of units is
+        propagated through them: a clause mentioning a true literal is
+        satisfied and dropped, a clause mentioning its negation loses
+        that literal, and any clause shrunk to a single literal joins
+        the worklist. Each clause is only touched when one of its
+        literals is actually resolved.
         """
-        # Get unit clauses as a set of unit literals
         model = {c.unit() for c in self.clauses if c.is_unit()}
-        if not model:  # No unit clauses to simplify
+        if not model:  # No unit clauses to propagate
+            self._units = model
             return
 
-        # Simplify the knowledge base with the current model
-        new_clauses = set()
+        # Index the non-unit clauses by their literals. The literal sets
+        # are mutable working copies; entries are dropped as clauses are
+        # satisfied or emptied.
+        remaining: list[set[Literal] | None] = []
+        occurrences: dict[Literal, set[int]] = {}
         for clause in self.clauses:
-            simplified_clause = clause.simplify(model)
-            if simplified_clause is None or simplified_clause.empty():
+            if clause.is_unit():
                 continue
-            new_clauses.add(simplified_clause)
-        new_clauses = new_clauses.union({Clause(lit) for lit in model})
-
-        # If the new clauses are the same as the old ones, do nothing
-        if self.clauses == new_clauses:
-            return
-
-        # Otherwise, update the knowledge base with the new clauses
+            literals = set(clause.literals)
+            index = len(remaining)
+            remaining.append(literals)
+            for lit in literals:
+                occurrences.setdefault(lit, set()).add(index)
+
+        # Units derived in one round only take effect in the next, so
+        # each clause sees a consistent model snapshot — exactly like the
+        # full rescan this replaces, which mattered when the dynamic
+        # world briefly leaves contradictory units in the base.
+        pending = model
+        model = set()
+        while pending:
+            new_units = pending - model
+            model.update(new_units)
+
+            affected = set()
+            for unit in new_units:
+                affected.update(occurrences.pop(unit, ()))
+                affected.update(occurrences.pop(~unit, ()))
+
+            pending = set()
+            for index in affected:
+                literals = remaining[index]
+                if literals is None:
+                    continue
+                if any(lit in model for lit in literals):
+                    remaining[index] = None  # Clause is satisfied
+                    continue
+                literals.difference_update(
+                    [lit for lit in literals if ~lit in model]
+                )
+                if len(literals) == 1:
+                    remaining[index] = None
+                    pending.add(next(iter(literals)))
+                elif not literals:
+                    remaining[index] = None  # Emptied clauses are dropped
+
+        new_clauses = {
+            Clause(*literals) for literals in remaining if literals
+        }
+        new_clauses.update(Clause(lit) for lit in model)
         self.clauses = new_clauses
-        self.infer()
+        self._units = model
 
     def _adjacent(self, i, j):
-        """Generate valid adjacent cell coordinates for a given cell (i, j).
+        """Get the valid adjacent cell coordinates for a given cell (i, j).
 
         Args:
             i (int): The row of the cell.
             j (int): The column of the cell.
 
-        Yields:
-            tuple[int, int]: The coordinates of an adjacent cell.
+        Returns:
+            tuple[tuple[int, int], ...]: The coordinates of the adjacent
+                cells, from the precomputed neighbor table.
         """
-        for di, dj in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
-            ni, nj = i + di, j + dj
-            if 0 <= ni < self.size and 0 <= nj < self.size:
-                yield (ni, nj)
+        return self._adj[(i, j)]
 
     def _make_percept_clauses(self, i, j, percepts: dict[str, bool]):
         """Generate clauses based on percepts for a given cell (i, j).
@@ -3,24 +3,43 @@ class Literal:
 
     A literal is an atomic formula (a propositional variable) or its negation.
 
+    Literals are interned: constructing the same (name, sign) pair twice
+    returns the same object, so the axiom generators and the inference
+    loop stop churning out throwaway instances of the handful of grid
+    symbols.
+
     Attributes:
         name (str): The name of the propositional variable.
         sign (bool): True for a positive literal, False for a negative (negated) literal.
     """
 
-    def __init__(self, name, sign=True):
-        """Initializes a Literal.
+    _pool: dict = {}
+
+    def __new__(cls, name, sign=True):
+        """Returns the interned Literal for the given name and sign.
 
         Args:
             name (str): The name of the literal.
             sign (bool, optional): The sign of the literal. Defaults to True.
         """
-        self.name = name
-        self.sign = sign  # True for positive, False for negated
+        key = (name, sign)
+        literal = cls._pool.get(key)
+        if literal is None:
+            literal = super().__new__(cls)
+            literal.name = name
+            literal.sign = sign  # True for positive, False for negated
+            literal._hash = hash(key)
+            literal._negation = None
+            cls._pool[key] = literal
+        return literal
+
+    def __getnewargs__(self):
+        """Arguments for reconstruction, so unpickling reuses the pool."""
+        return (self.name, self.sign)
 
     def __hash__(self):
         """Computes the hash of the literal."""
-        return hash((self.name, self.sign))
+        return self._hash
 
     def __eq__(self, other):
         """Checks if two literals are equal."""
@@ -32,7 +51,12 @@ class Literal:
 
     def __invert__(self):
         """Returns the negation of the literal."""
-        return Literal(self.name, not self.sign)
+        negation = self._negation
+        if negation is None:
+            negation = Literal(self.name, not self.sign)
+            self._negation = negation
+            negation._negation = self
+        return negation
 
     def __or__(self, other):
         """Creates a clause by ORing this literal with another literal or clause.
@@ -59,10 +83,13 @@ class Literal:
 class Clause():
     """Represents a clause in propositional logic.
 
-    A clause is a disjunction of literals.
+    A clause is a disjunction of literals. The literal set is frozen on
+    construction and the hash computed once, since clauses spend their
+    lives inside the knowledge base's sets and every insertion or lookup
+    used to re-sort the literals just to hash them.
 
     Attributes:
-        literals (set[Literal]): A set of literals in the clause.
+        literals (frozenset[Literal]): The set of literals in the clause.
     """
 
     def __init__(self, *literals):
@@ -71,11 +98,12 @@ class Clause():
         Args:
             *literals: A variable number of Literal objects.
         """
-        self.literals = set(literals)
+        self.literals = frozenset(literals)
+        self._hash = hash(self.literals)
 
     def __hash__(self):
-        """Computes the hash of the clause."""
-        return hash(tuple(sorted(self.literals, key=lambda x: (x.sign, x.name))))
+        """Returns the precomputed hash of the clause."""
+        return self._hash
 
     def __eq__(self, other):
         """Checks if two clauses are equal."""
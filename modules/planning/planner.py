@@ -152,3 +152,27 @@ class RoutePlanner(SearchProblem):
         """
         result = AStarSearch(self)()
         return result.solution() if result else []
+
+    def plan_route_any(self, goal_sets):
+        """Plan a route to the first goal set that yields a plan.
+
+        The goal sets are tried in priority order on the same allowed map,
+        reusing this planner instance instead of building a new one per
+        attempt. Empty goal sets are skipped.
+
+        Args:
+            goal_sets (list): Prioritized goals, each a position or a
+                collection of positions as accepted by the constructor.
+
+        Returns:
+            tuple[list[Action], int]: The planned actions and the index of
+                the goal set they reach, or ([], -1) if none is reachable.
+        """
+        for index, goals in enumerate(goal_sets):
+            if isinstance(goals, (list, set)) and len(goals) == 0:
+                continue
+            self.goal = goals
+            actions = self.plan_route()
+            if actions:
+                return actions, index
+        return [], -1
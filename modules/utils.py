@@ -23,13 +23,7 @@ class Orientation(Enum):
         Returns:
             Orientation: The new orientation after a 90-degree left turn.
         """
-        if orientation == Orientation.NORTH:
-            return Orientation.WEST
-        if orientation == Orientation.WEST:
-            return Orientation.SOUTH
-        if orientation == Orientation.SOUTH:
-            return Orientation.EAST
-        return Orientation.NORTH  # EAST
+        return _RING[_RING_INDEX[orientation] - 1]
 
     @staticmethod
     def turn_right(orientation):
@@ -41,13 +35,7 @@ class Orientation(Enum):
         Returns:
             Orientation: The new orientation after a 90-degree right turn.
         """
-        if orientation == Orientation.NORTH:
-            return Orientation.EAST
-        if orientation == Orientation.EAST:
-            return Orientation.SOUTH
-        if orientation == Orientation.SOUTH:
-            return Orientation.WEST
-        return Orientation.NORTH  # WEST
+        return _RING[(_RING_INDEX[orientation] + 1) % 4]
 
     @staticmethod
     def forward(orientation, x, y):
@@ -61,13 +49,8 @@ class Orientation(Enum):
         Returns:
             tuple[int, int]: The new (x, y) coordinates.
         """
-        if orientation == Orientation.NORTH:
-            return x, y + 1
-        if orientation == Orientation.EAST:
-            return x + 1, y
-        if orientation == Orientation.SOUTH:
-            return x, y - 1
-        return x - 1, y  # WEST
+        dx, dy = _FORWARD_DELTA[orientation]
+        return x + dx, y + dy
 
     def __hash__(self):
         """Returns a hash value for the orientation."""
@@ -85,16 +68,7 @@ class Orientation(Enum):
         Returns:
             bool: True if this orientation is "less than" the other.
         """
-        if self.value == other.value:
-            return False
-
-        if self.value == "East":
-            return True
-        if self.value == "South":
-            return other.value in ["West", "North"]
-        if self.value == "West":
-            return other.value in ["North"]
-        return False  # North
+        return _TIE_INDEX[self] < _TIE_INDEX[other]
 
     def __sub__(self, other):
         """Calculates the "distance" between two orientations.
@@ -108,11 +82,38 @@ class Orientation(Enum):
         Returns:
             int: 0 for same orientation, 1 for adjacent, 2 for opposite.
         """
-        if self.value == other.value:
+        if self is other:
             return 0
-        if self.value in ["North", "East"]:
-            return 1 if other.value in ["South", "West"] else 2
-        return 1 if other.value in ["North", "East"] else 2  # South or West
+        return 1 if _AXIS_GROUP[self] != _AXIS_GROUP[other] else 2
+
+
+# Lookup tables backing the Orientation methods, so turning, moving and
+# comparing are single dict/tuple lookups instead of chains of string
+# comparisons. _RING is the clockwise turn order, _TIE_INDEX the
+# East < South < West < North tie-break order, and _AXIS_GROUP encodes
+# the {North, East} vs {South, West} split the turn distance is based on.
+_RING = (
+    Orientation.NORTH, Orientation.EAST, Orientation.SOUTH, Orientation.WEST
+)
+_RING_INDEX = {orientation: i for i, orientation in enumerate(_RING)}
+_TIE_INDEX = {
+    Orientation.EAST: 0,
+    Orientation.SOUTH: 1,
+    Orientation.WEST: 2,
+    Orientation.NORTH: 3,
+}
+_AXIS_GROUP = {
+    Orientation.NORTH: 0,
+    Orientation.EAST: 0,
+    Orientation.SOUTH: 1,
+    Orientation.WEST: 1,
+}
+_FORWARD_DELTA = {
+    Orientation.NORTH: (0, 1),
+    Orientation.EAST: (1, 0),
+    Orientation.SOUTH: (0, -1),
+    Orientation.WEST: (-1, 0),
+}
 
 
 class Position:
@@ -18,9 +18,7 @@ class InfoSection:
         surface.blit(self.game_indicators, self.game_indicators.position)
 
     def handle_events(self, surface: pygame.Surface, events, dt: float, env):
-        new_env = {**env}
-
-        return new_env
+        return env  # This section never changes the environment
 
     def __init_info_panel(self) -> Panel:
         items = {